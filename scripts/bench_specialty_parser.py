@@ -0,0 +1,149 @@
+import json
+import sqlite3
+import sys
+import time
+import os
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from specialty_parser import SpecialtyParser, build_specialty_dictionary, parse_specialties, scan_cells
+
+DB_FILE = 'database/journals.db'
+VAK_LISK_FILE = 'data/vak_lisk.pdf'
+# Ячейки в формате перечня с ожидаемыми кодами: строки-продолжения,
+# перенесенные названия, цифры внутри названий, незнакомые коды
+SAMPLE_FILE = 'data/specialty_cells_sample.jsonl'
+REPEATS = 5
+
+def load_cells_from_pdf():
+    """Извлекает ячейки специальностей из vak_lisk.pdf (как в process_vak.py)."""
+    from process_vak import extract_vak_lisk_entries
+    entries = extract_vak_lisk_entries()
+    return [text for entry in entries for text in entry["specialties_texts"]]
+
+def load_sample_cells():
+    """Загружает ячейки с ожидаемыми кодами: список пар (текст, коды)."""
+    with open(SAMPLE_FILE, encoding='utf-8') as f:
+        return [(item["text"], item["codes"]) for item in map(json.loads, f) if item]
+
+def load_cells_from_db(conn):
+    """
+    Восстанавливает ячейки специальностей по базе данных: для каждого
+    журнала коды и названия склеиваются в одну строку, как в перечне.
+    Такие ячейки синтетические: в них нет строк-продолжений и цифр
+    в названиях, поэтому они годятся только для замера скорости.
+    """
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT js.journal_id, s.code, s.name
+        FROM journal_specialties js
+        JOIN specialties s ON js.specialty_id = s.id
+        ORDER BY js.journal_id, s.code
+    """)
+    cells = {}
+    for journal_id, code, name in cursor.fetchall():
+        cells.setdefault(journal_id, []).append(f"{code} {name}")
+    return [', '.join(parts) for parts in cells.values()]
+
+def parse_with_regex(cells):
+    """Разбирает ячейки исходным регулярным выражением."""
+    return [parse_specialties(text) for text in cells]
+
+def parse_with_trie(cells, known=()):
+    """
+    Разбирает ячейки так же, как process_vak.py: словарь кодов из
+    номенклатуры и предварительного прохода по ячейкам, затем trie.
+    """
+    scanned = scan_cells(cells)
+    parser = SpecialtyParser(build_specialty_dictionary(known, scanned))
+    return [parser.parse(text, codes) for text, codes in scanned]
+
+def measure(run, cells):
+    """Возвращает лучшее время (в секундах) обработки всех ячеек функцией run из REPEATS запусков."""
+    best = None
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        run(cells)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def check_sample(known):
+    """Сравнивает коды, найденные обоими способами, с ожидаемыми на SAMPLE_FILE."""
+    sample = load_sample_cells()
+    # Словарь только из номенклатуры, чтобы незнакомые коды шли через регулярное выражение
+    parser = SpecialtyParser(build_specialty_dictionary(known))
+
+    regex_correct = 0
+    trie_correct = 0
+    for text, expected in sample:
+        regex_codes = [spec["code"] for spec in parse_specialties(text)]
+        trie_codes = [spec["code"] for spec in parser.parse(text)]
+        regex_correct += regex_codes == expected
+        trie_correct += trie_codes == expected
+        if trie_codes != expected:
+            print(f"  ❌ {text[:60]}...: ожидалось {expected}, получено {trie_codes}")
+
+    print(f"Проверка на {SAMPLE_FILE} ({len(sample)} ячеек):")
+    print(f"  Регулярное выражение: верно {regex_correct}")
+    print(f"  Словарь кодов (trie): верно {trie_correct}, "
+          f"через регулярное выражение: {parser.stats['fallbacks']}, "
+          f"незнакомых кодов: {parser.stats['unknown_codes']}, "
+          f"кодов без разделителя: {parser.stats['no_separator']}")
+
+def run_benchmark():
+    """Сравнивает разбор по словарю кодов с исходным регулярным выражением."""
+    conn = sqlite3.connect(DB_FILE)
+    try:
+        if os.path.exists(VAK_LISK_FILE):
+            cells = load_cells_from_pdf()
+            source = VAK_LISK_FILE
+        else:
+            cells = load_cells_from_db(conn)
+            source = DB_FILE
+        known = conn.execute("SELECT code, name FROM specialties").fetchall()
+    finally:
+        conn.close()
+
+    if os.path.exists(SAMPLE_FILE):
+        check_sample(known)
+        print()
+
+    if not cells:
+        print("Не найдено ни одной ячейки со специальностями.")
+        return
+
+    if source == DB_FILE:
+        print(f"⚠️ Файл '{VAK_LISK_FILE}' не найден, ячейки восстановлены по базе данных.")
+        print("   Они синтетические и подходят только для замера скорости, но не для проверки разбора.")
+
+    # При загрузке база создается заново, поэтому номенклатура пуста и
+    # словарь строится только предварительным проходом по ячейкам.
+    # Время trie включает построение словаря.
+    regex_time = measure(parse_with_regex, cells)
+    dictionary_time = measure(lambda cells: build_specialty_dictionary((), scan_cells(cells)), cells)
+    trie_time = measure(parse_with_trie, cells)
+    dictionary = build_specialty_dictionary((), scan_cells(cells))
+
+    # Отдельный проход для сравнения результатов и подсчета статистики
+    parser = SpecialtyParser(dictionary)
+    differing = sum(
+        1 for text in cells
+        if [s["code"] for s in parse_specialties(text)] != [s["code"] for s in parser.parse(text)]
+    )
+
+    print(f"Источник ячеек: {source}, ячеек: {len(cells)}, кодов в словаре: {len(dictionary)}")
+    print(f"Регулярное выражение: {regex_time * 1000:.1f} мс")
+    print(f"Словарь кодов (trie) вместе с построением словаря: {trie_time * 1000:.1f} мс ({regex_time / trie_time:.2f}x), "
+          f"из них сканирование и построение словаря: {dictionary_time * 1000:.1f} мс")
+    print(f"Ячеек с разным набором кодов: {differing}")
+    print(f"Разборов через регулярное выражение: {parser.stats['fallbacks']}, "
+          f"незнакомых кодов: {parser.stats['unknown_codes']}, "
+          f"кодов без разделителя: {parser.stats['no_separator']}")
+
+if __name__ == "__main__":
+    if os.path.exists(DB_FILE):
+        run_benchmark()
+    else:
+        print(f"Файл базы данных '{DB_FILE}' не найден.")
@@ -5,7 +5,8 @@ DB_FILE = 'database/journals.db'
 
 def check_database_content():
     """
-    Проверяет содержимое базы данных: считает записи и выводит примеры.
+    Проверяет содержимое базы данных: считает записи и выводит сводную
+    статистику по категориям ВАК и группам специальностей.
     """
     try:
         conn = sqlite3.connect(DB_FILE)
@@ -21,32 +22,46 @@ def check_database_content():
         specialty_count = cursor.fetchone()[0]
         print(f"✅ Всего уникальных специальностей: {specialty_count}")
         
-        print("\n--- 5 случайных журналов в базе и их специальности: ---")
-        cursor.execute("SELECT id, title, issn FROM journals ORDER BY RANDOM() LIMIT 5")
-        journals = cursor.fetchall()
-        
-        if not journals:
+        # 3. Сводная статистика, рассчитанная при загрузке данных
+        cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'specialty_summary'")
+        if not cursor.fetchone():
+            print("\nТаблица 'specialty_summary' не найдена. Запустите src/summary_stats.py.")
+            return
+
+        print("\n--- Журналы по категориям ВАК: ---")
+        cursor.execute("""
+            SELECT vak_category, SUM(journal_count), SUM(CASE WHEN scopus_indexed THEN journal_count ELSE 0 END)
+            FROM specialty_summary
+            WHERE level = 'all'
+            GROUP BY vak_category
+            ORDER BY vak_category
+        """)
+        for category, total, in_scopus in cursor.fetchall():
+            print(f"  - {category}: {total} (в Scopus: {in_scopus})")
+
+        print("\n--- Группы специальностей (К1 / К2 / К3 / в Scopus / всего): ---")
+        cursor.execute("""
+            SELECT
+                code,
+                SUM(CASE WHEN ' ' || vak_category || ' ' LIKE '% К1 %' THEN journal_count ELSE 0 END),
+                SUM(CASE WHEN ' ' || vak_category || ' ' LIKE '% К2 %' THEN journal_count ELSE 0 END),
+                SUM(CASE WHEN ' ' || vak_category || ' ' LIKE '% К3 %' THEN journal_count ELSE 0 END),
+                SUM(CASE WHEN scopus_indexed THEN journal_count ELSE 0 END),
+                SUM(journal_count)
+            FROM specialty_summary
+            WHERE level = 'group'
+            GROUP BY code
+            ORDER BY SUM(journal_count) DESC
+        """)
+        groups = cursor.fetchall()
+
+        if not groups:
             print("В базе данных не найдено журналов.")
             return
 
-        for journal in journals:
-            journal_id, journal_title, journal_issn = journal
-            print(f"\n[+] Журнал: {journal_title} (ID: {journal_id}, ISSN: {journal_issn})")
-
-            query = """
-            SELECT s.code, s.name 
-            FROM specialties s
-            JOIN journal_specialties js ON s.id = js.specialty_id
-            WHERE js.journal_id = ?
-            """
-            cursor.execute(query, (journal_id,))
-            specs = cursor.fetchall()
-            
-            if specs:
-                for spec in specs:
-                    print(f"  - Код: {spec[0]}, Название: {spec[1]}")
-            else:
-                print("  Специальности не найдены.")
+        for code, k1, k2, k3, in_scopus, total in groups:
+            print(f"  - {code}: {k1} / {k2} / {k3} / {in_scopus} / {total}")
+        print("\nЖурналы с двумя категориями (например, 'К1 К2') учитываются в каждой из них.")
 
     except sqlite3.Error as e:
         print(f"❌ Произошла ошибка при проверке базы данных: {e}")
@@ -3,9 +3,17 @@ import pandas as pd
 import sqlite3
 from pathlib import Path
 
+from journal_query import count_journals, find_journals, get_db_connection, iter_journals
+from summary_stats import NO_CATEGORY, split_category
+
 # --- Настройки ---
 # Путь к базе данных относительно корня проекта
 DB_FILE = "database/journals.db"
+# Категории ВАК, которые выводятся отдельными колонками в сводной статистике
+SUMMARY_CATEGORIES = ['К1', 'К2', 'К3', 'К?']
+# Варианты сортировки и размера страницы результатов поиска
+ORDER_OPTIONS = {"По названию": 'title', "По категории ВАК": 'category'}
+PAGE_SIZE_OPTIONS = [25, 50, 100]
 st.set_page_config(page_title="Поиск журналов ВАК", layout="wide")
 
 
@@ -34,32 +42,108 @@ def get_all_specialties():
         return []
 
 @st.cache_data
-def find_journals_by_specialty(specialty_code):
+def get_vak_categories():
     """
-    Находит все журналы по указанному коду специальности.
-    Возвращает pandas DataFrame.
+    Загружает категории ВАК, встречающиеся в базе, для фильтра.
+    Составные категории ('К1 К2') разбиваются на части.
     """
-    conn = sqlite3.connect(DB_FILE)
-    query = """
-        SELECT
-            j.title,
-            j.issn,
-            j.vak_category,
-            j.scopus_indexed
-        FROM
-            journals j
-        JOIN
-            journal_specialties js ON j.id = js.journal_id
-        JOIN
-            specialties s ON js.specialty_id = s.id
-        WHERE
-            s.code = ?
-        ORDER BY
-            j.title;
+    try:
+        conn = sqlite3.connect(DB_FILE)
+        cursor = conn.cursor()
+        cursor.execute("SELECT DISTINCT vak_category FROM journals")
+        parts = {part for (category,) in cursor.fetchall() for part in split_category(category)}
+        conn.close()
+        # Журналы без категории — в конце списка
+        return sorted(parts, key=lambda part: (part == NO_CATEGORY, part))
+    except sqlite3.Error:
+        return []
+
+def format_journals(journals):
+    """Переводит список журналов в DataFrame с понятными названиями колонок и значениями."""
+    df = pd.DataFrame(journals, columns=['title', 'issn', 'vak_category', 'scopus_indexed'])
+    # Переименовываем колонки для наглядности
+    df.rename(columns={
+        'title': 'Название журнала',
+        'issn': 'ISSN',
+        'vak_category': 'Категория ВАК',
+        'scopus_indexed': 'В Scopus'
+    }, inplace=True)
+
+    # Заменяем значения для лучшего восприятия
+    df['В Scopus'] = df['В Scopus'].apply(lambda x: 'Да' if x == 1 else 'Нет')
+    df['Категория ВАК'] = df['Категория ВАК'].fillna(NO_CATEGORY)
+    return df
+
+@st.cache_data
+def count_filtered_journals(filters):
+    """Считает журналы, удовлетворяющие фильтрам (см. journal_query.build_filters)."""
+    conn = get_db_connection()
+    count = count_journals(conn, **filters)
+    conn.close()
+    return count
+
+@st.cache_data
+def find_journals_page(filters, order_by, after, page_size):
     """
-    df = pd.read_sql_query(query, conn, params=(specialty_code,))
+    Загружает одну страницу журналов, удовлетворяющих фильтрам.
+    Возвращает pandas DataFrame и ключ следующей страницы (или None).
+    """
+    conn = get_db_connection()
+    journals, next_after = find_journals(conn, order_by=order_by, after=after, limit=page_size, **filters)
     conn.close()
-    return df
+    return format_journals(journals), next_after
+
+def export_filtered_journals(filters, order_by):
+    """Выгружает все журналы, удовлетворяющие фильтрам, в CSV (постранично из базы)."""
+    conn = get_db_connection()
+    df = format_journals(list(iter_journals(conn, order_by=order_by, **filters)))
+    conn.close()
+    return convert_df_to_csv(df)
+
+@st.cache_data
+def get_specialty_summary(level):
+    """
+    Загружает сводную статистику (таблица specialty_summary) для уровня
+    'all', 'group' или 'specialty'. Возвращает pandas DataFrame, где для
+    каждого кода указано число журналов по категориям ВАК, в Scopus и всего.
+    Журналы с составной категорией (например, 'К1 К2') учитываются в каждой
+    из ее частей, поэтому "Всего" может быть меньше суммы по категориям.
+    """
+    try:
+        conn = sqlite3.connect(DB_FILE)
+        df = pd.read_sql_query(
+            "SELECT code, name, vak_category, scopus_indexed, journal_count FROM specialty_summary WHERE level = ?",
+            conn, params=(level,)
+        )
+        conn.close()
+    except Exception:
+        # Таблицы specialty_summary нет (база создана до ее появления)
+        return pd.DataFrame()
+
+    if df.empty:
+        return df
+
+    df['name'] = df['name'].fillna('')
+    by_category = df.assign(vak_category=df['vak_category'].apply(split_category)).explode('vak_category')
+    summary = by_category.pivot_table(
+        index=['code', 'name'], columns='vak_category', values='journal_count',
+        aggfunc='sum', fill_value=0
+    )
+    for category in SUMMARY_CATEGORIES:
+        if category not in summary.columns:
+            summary[category] = 0
+    summary['В Scopus'] = df[df['scopus_indexed'] == 1].groupby(['code', 'name'])['journal_count'].sum()
+    summary['Всего'] = df.groupby(['code', 'name'])['journal_count'].sum()
+    summary = summary[SUMMARY_CATEGORIES + ['В Scopus', 'Всего']].fillna(0).astype(int)
+    summary.columns.name = None
+    return summary.reset_index().rename(columns={'code': 'Код', 'name': 'Название'})
+
+def show_summary_metrics(row):
+    """Выводит количество журналов по категориям ВАК и в Scopus в виде метрик."""
+    columns = st.columns(len(SUMMARY_CATEGORIES) + 2)
+    for column, label in zip(columns, ['Всего'] + SUMMARY_CATEGORIES + ['В Scopus']):
+        column.metric(label, int(row[label]))
+    st.caption("Журналы с двумя категориями (например, «К1 К2») учитываются в каждой из них.")
 
 
 # --- Боковая панель (Sidebar) ---
@@ -103,59 +187,137 @@ if not Path(DB_FILE).exists():
     st.error(f"❌ **Ошибка:** Файл базы данных '{DB_FILE}' не найден. Приложение не может запуститься.")
     st.info("Пожалуйста, убедитесь, что база данных создана и находится в той же папке, что и приложение.")
 else:
-    # Загружаем специальности для выпадающего списка
-    specialties = get_all_specialties()
-
-    if not specialties:
-        st.warning("В базе данных не найдено ни одной специальности. Невозможно выполнить поиск.")
-    else:
-        # Создаем выпадающий список с возможностью поиска
-        placeholder = "-- Выберите специальность из списка или начните вводить код/название --"
-        options = [placeholder] + specialties
-        
-        selected_option = st.selectbox(
-            "Научная специальность:",
-            options,
-            help="Начните вводить код (например, '1.2.1') или ключевое слово из названия (например, 'Анатомия'), чтобы отфильтровать список."
-        )
+    search_tab, overview_tab = st.tabs(["🔎 Поиск журналов", "📊 Обзор по специальностям"])
+
+    with overview_tab:
+        # Сводная статистика рассчитывается при загрузке данных, поэтому
+        # страница не обращается к списку журналов
+        total_summary = get_specialty_summary('all')
+
+        if total_summary.empty:
+            st.warning("Сводная статистика не найдена. Запустите `python src/summary_stats.py`.")
+        else:
+            show_summary_metrics(total_summary.iloc[0])
+
+            level_label = st.radio(
+                "Уровень:",
+                ["Группы специальностей", "Специальности"],
+                horizontal=True
+            )
+            level = 'group' if level_label == "Группы специальностей" else 'specialty'
+            summary_df = get_specialty_summary(level)
+            if level == 'group':
+                summary_df = summary_df.drop(columns=['Название'])
+
+            st.dataframe(summary_df, use_container_width=True, hide_index=True)
+
+    with search_tab:
+        # Загружаем специальности для выпадающего списка
+        specialties = get_all_specialties()
+
+        if not specialties:
+            st.warning("В базе данных не найдено ни одной специальности. Невозможно выполнить поиск.")
+        else:
+            # Создаем список с возможностью поиска и выбора нескольких специальностей
+            selected_options = st.multiselect(
+                "Научные специальности:",
+                specialties,
+                placeholder="Выберите специальности из списка или начните вводить код/название",
+                help="Начните вводить код (например, '1.2.1') или ключевое слово из названия (например, 'Анатомия'), чтобы отфильтровать список."
+            )
+            # Извлекаем коды из выбранных строк "Код - Название"
+            selected_codes = [option.split(' - ')[0] for option in selected_options]
+
+            match_all = False
+            if len(selected_codes) > 1:
+                match_mode = st.radio(
+                    "Журнал должен относиться:",
+                    ["К любой из выбранных специальностей", "Ко всем выбранным специальностям"],
+                    horizontal=True
+                )
+                match_all = match_mode == "Ко всем выбранным специальностям"
+
+            # --- Дополнительные фильтры ---
+            filter_columns = st.columns(3)
+            selected_categories = filter_columns[0].multiselect(
+                "Категория ВАК:",
+                get_vak_categories(),
+                placeholder="Любая"
+            )
+            scopus_option = filter_columns[1].selectbox(
+                "Индексация в Scopus:",
+                ["Не важно", "Только в Scopus", "Только не в Scopus"]
+            )
+            title_query = filter_columns[2].text_input("Название содержит:").strip()
+
+            order_columns = st.columns(2)
+            order_label = order_columns[0].selectbox("Сортировка:", list(ORDER_OPTIONS))
+            page_size = order_columns[1].selectbox("Журналов на странице:", PAGE_SIZE_OPTIONS, index=1)
+
+            filters = {
+                "specialty_codes": tuple(selected_codes),
+                "match_all": match_all,
+                "categories": tuple(selected_categories),
+                "scopus": {"Только в Scopus": True, "Только не в Scopus": False}.get(scopus_option),
+                "title": title_query or None,
+            }
+            order_by = ORDER_OPTIONS[order_label]
+
+            # Если пользователь задал хотя бы один фильтр
+            if selected_codes or selected_categories or filters["scopus"] is not None or title_query:
+                # Сначала показываем сводную статистику, если выбрана одна специальность
+                if len(selected_codes) == 1:
+                    specialty_summary = get_specialty_summary('specialty')
+                    if not specialty_summary.empty:
+                        selected_summary = specialty_summary[specialty_summary['Код'] == selected_codes[0]]
+                        if not selected_summary.empty:
+                            show_summary_metrics(selected_summary.iloc[0])
+
+                # При изменении фильтров возвращаемся на первую страницу.
+                # page_keys хранит ключи начала каждой просмотренной страницы.
+                search_key = (tuple(sorted(filters.items())), order_by, page_size)
+                if st.session_state.get("search_key") != search_key:
+                    st.session_state.search_key = search_key
+                    st.session_state.page_keys = [None]
+
+                page_keys = st.session_state.page_keys
+                total_count = count_filtered_journals(filters)
+                results_df, next_after = find_journals_page(filters, order_by, page_keys[-1], page_size)
+
+                st.markdown("---") # Разделитель
 
-        # Если пользователь выбрал специальность (а не placeholder)
-        if selected_option != placeholder:
-            # Извлекаем код из выбранной строки "Код - Название"
-            selected_code = selected_option.split(' - ')[0]
+                if results_df.empty:
+                    st.info("ℹ️ По заданным фильтрам журналы в базе не найдены.")
+                else:
+                    page_count = (total_count + page_size - 1) // page_size
+                    st.success(f"✅ Найдено **{total_count}** журнал(ов). Страница {len(page_keys)} из {page_count}.")
 
-            # Ищем журналы и выводим результаты
-            results_df = find_journals_by_specialty(selected_code)
+                    # Выводим страницу результатов как интерактивную таблицу
+                    st.dataframe(results_df, use_container_width=True, hide_index=True)
 
-            st.markdown("---") # Разделитель
+                    # --- Переход между страницами ---
+                    nav_columns = st.columns(2)
+                    nav_columns[0].button(
+                        "← Назад",
+                        disabled=len(page_keys) == 1,
+                        on_click=lambda: st.session_state.page_keys.pop()
+                    )
+                    nav_columns[1].button(
+                        "Далее →",
+                        disabled=next_after is None,
+                        on_click=lambda: st.session_state.page_keys.append(next_after)
+                    )
 
-            if results_df.empty:
-                st.info("ℹ️ По данной специальности журналы в базе не найдены.")
+                    # --- Кнопка для скачивания ---
+                    # Полный список выгружается только по запросу, чтобы не читать
+                    # все результаты при каждом изменении фильтров
+                    if st.button("📄 Подготовить CSV со всеми результатами"):
+                        file_suffix = '_'.join(selected_codes) if selected_codes else 'search'
+                        st.download_button(
+                           label="📥 Скачать результаты в CSV",
+                           data=export_filtered_journals(filters, order_by),
+                           file_name=f'jurnalizer_{file_suffix}.csv',
+                           mime='text/csv',
+                        )
             else:
-                st.success(f"✅ Найдено **{len(results_df)}** журнал(ов).")
-
-                # --- Форматирование данных для отображения ---
-                # Переименовываем колонки для наглядности
-                results_df.rename(columns={
-                    'title': 'Название журнала',
-                    'issn': 'ISSN',
-                    'vak_category': 'Категория ВАК',
-                    'scopus_indexed': 'В Scopus'
-                }, inplace=True)
-                
-                # Заменяем значения для лучшего восприятия
-                results_df['В Scopus'] = results_df['В Scopus'].apply(lambda x: 'Да' if x == 1 else 'Нет')
-                results_df['Категория ВАК'] = results_df['Категория ВАК'].fillna('Нет данных')
-                
-                # Выводим DataFrame как интерактивную таблицу
-                st.dataframe(results_df, use_container_width=True)
-
-                # --- Кнопка для скачивания ---
-                csv_data = convert_df_to_csv(results_df)
-
-                st.download_button(
-                   label="📥 Скачать результаты в CSV",
-                   data=csv_data,
-                   file_name=f'jurnalizer_{selected_code}.csv',
-                   mime='text/csv',
-                ) 
\ No newline at end of file
+                st.info("ℹ️ Выберите специальности или задайте другие фильтры, чтобы увидеть список журналов.")
@@ -1,12 +1,15 @@
 import sqlite3
 import os
 
+from journal_query import create_query_indexes
+from summary_stats import create_summary_table
+
 DB_FILE = 'journals.db'
 
 def create_database():
     """
-    Создает базу данных SQLite с тремя таблицами: journals, specialties,
-    и journal_specialties. Если файл базы данных уже существует, он будет
+    Создает базу данных SQLite с таблицами journals, specialties, journal_specialties
+    и specialty_summary. Если файл базы данных уже существует, он будет
     удален и создан заново.
     """
     # Удаляем старый файл БД, если он существует
@@ -54,6 +57,12 @@ def create_database():
         )
         ''')
 
+        # 4. Создаем индексы для фильтров и постраничной выборки журналов
+        create_query_indexes(cursor)
+
+        # 5. Создаем таблицу specialty_summary (сводная статистика по специальностям)
+        create_summary_table(cursor)
+
         conn.commit()
         print(f"База данных '{DB_FILE}' и таблицы успешно созданы.")
 
@@ -0,0 +1,175 @@
+import sqlite3
+import os
+
+from summary_stats import NO_CATEGORY
+
+DB_FILE = 'database/journals.db'
+
+# Размер страницы результатов по умолчанию
+PAGE_SIZE = 50
+
+# Порядок сортировки: выражения ORDER BY (к ним всегда добавляется j.id,
+# чтобы ключ страницы был уникальным). Для каждого порядка есть индекс.
+ORDER_COLUMNS = {
+    'title': ["j.title"],
+    'category': ["IFNULL(j.vak_category, '')", "j.title"],
+}
+
+def create_query_indexes(cursor):
+    """Создает индексы, на которые опираются фильтры и постраничная выборка."""
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_journal_specialties_specialty ON journal_specialties (specialty_id, journal_id)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_journals_title ON journals (title, id)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_journals_category ON journals (IFNULL(vak_category, ''), title, id)")
+
+def get_db_connection():
+    """
+    Возвращает соединение с базой данных. Регистрирует функцию casefold,
+    так как встроенные LOWER и LIKE в SQLite не учитывают регистр кириллицы.
+    """
+    conn = sqlite3.connect(DB_FILE)
+    conn.row_factory = sqlite3.Row
+    conn.create_function("casefold", 1, lambda text: text.casefold() if text is not None else None, deterministic=True)
+    return conn
+
+def escape_like(text):
+    """Экранирует спецсимволы шаблона LIKE."""
+    return text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+def build_filters(specialty_codes=(), match_all=False, categories=(), scopus=None, title=None):
+    """
+    Собирает условие WHERE и параметры для выборки журналов.
+
+    specialty_codes — коды специальностей; при match_all=False журнал должен
+    относиться хотя бы к одной из них (объединение), при True — ко всем (пересечение).
+    categories — категории ВАК; журнал подходит, если его категория содержит
+    любую из них (для 'К1 К2' подходят и 'К1', и 'К2'). NO_CATEGORY — журналы
+    без категории.
+    scopus — True/False для фильтра по индексации в Scopus, None — без фильтра.
+    title — подстрока названия без учета регистра.
+    """
+    conditions = []
+    params = []
+
+    codes = sorted(set(specialty_codes))
+    if codes:
+        placeholders = ', '.join('?' * len(codes))
+        subquery = f"""
+            SELECT js.journal_id
+            FROM journal_specialties js
+            JOIN specialties s ON js.specialty_id = s.id
+            WHERE s.code IN ({placeholders})
+        """
+        if match_all:
+            subquery += " GROUP BY js.journal_id HAVING COUNT(DISTINCT s.code) = ?"
+            params.extend(codes)
+            params.append(len(codes))
+        else:
+            params.extend(codes)
+        conditions.append(f"j.id IN ({subquery})")
+
+    if categories:
+        category_conditions = []
+        for category in categories:
+            if category != NO_CATEGORY:
+                # Сравниваем с частями составной категории, разделенными пробелами
+                category_conditions.append("' ' || j.vak_category || ' ' LIKE ? ESCAPE '\\'")
+                params.append(f"% {escape_like(category)} %")
+        if NO_CATEGORY in categories:
+            category_conditions.append("j.vak_category IS NULL")
+        conditions.append(f"({' OR '.join(category_conditions)})")
+
+    if scopus is not None:
+        conditions.append("j.scopus_indexed = ?")
+        params.append(1 if scopus else 0)
+
+    if title:
+        conditions.append("casefold(j.title) LIKE ? ESCAPE '\\'")
+        params.append(f"%{escape_like(title.casefold())}%")
+
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    return where, params
+
+def count_journals(conn, **filters):
+    """Возвращает количество журналов, удовлетворяющих фильтрам."""
+    where, params = build_filters(**filters)
+    cursor = conn.execute(f"SELECT COUNT(*) FROM journals j {where}", params)
+    return cursor.fetchone()[0]
+
+def find_journals(conn, order_by='title', after=None, limit=PAGE_SIZE, **filters):
+    """
+    Возвращает одну страницу журналов, удовлетворяющих фильтрам (см. build_filters).
+
+    Страницы выбираются по ключу (keyset pagination): after — ключ последней
+    строки предыдущей страницы или None для первой страницы. Возвращает пару
+    (список строк, ключ для следующей страницы или None, если страница последняя).
+    """
+    if order_by not in ORDER_COLUMNS:
+        raise ValueError(f"Неизвестный порядок сортировки: {order_by}")
+
+    key_columns = ORDER_COLUMNS[order_by] + ["j.id"]
+    where, params = build_filters(**filters)
+
+    if after is not None:
+        keyset_condition = f"({', '.join(key_columns)}) > ({', '.join('?' * len(key_columns))})"
+        where = f"{where} AND {keyset_condition}" if where else f"WHERE {keyset_condition}"
+        params = params + list(after)
+
+    query = f"""
+        SELECT
+            j.id,
+            j.title,
+            j.issn,
+            j.vak_category,
+            j.scopus_indexed,
+            {', '.join(f'{column} AS sort_key_{i}' for i, column in enumerate(key_columns))}
+        FROM
+            journals j
+        {where}
+        ORDER BY
+            {', '.join(key_columns)}
+        LIMIT ?
+    """
+    # Берем на одну строку больше, чтобы узнать, есть ли следующая страница
+    rows = conn.execute(query, params + [limit + 1]).fetchall()
+
+    next_after = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_after = tuple(last[f"sort_key_{i}"] for i in range(len(key_columns)))
+
+    journals = [
+        {
+            "title": row["title"],
+            "issn": row["issn"],
+            "vak_category": row["vak_category"],
+            "scopus_indexed": row["scopus_indexed"],
+        }
+        for row in rows
+    ]
+    return journals, next_after
+
+def iter_journals(conn, order_by='title', page_size=PAGE_SIZE, **filters):
+    """Последовательно выдает все журналы, удовлетворяющие фильтрам, постранично."""
+    after = None
+    while True:
+        journals, after = find_journals(conn, order_by=order_by, after=after, limit=page_size, **filters)
+        yield from journals
+        if after is None:
+            break
+
+
+if __name__ == '__main__':
+    # Добавляет индексы в уже существующую базу данных
+    if not os.path.exists(DB_FILE):
+        print(f"❌ База данных '{DB_FILE}' не найдена. Пожалуйста, создайте ее сначала.")
+    else:
+        conn = sqlite3.connect(DB_FILE)
+        try:
+            create_query_indexes(conn.cursor())
+            conn.commit()
+            print("✅ Индексы для поиска журналов созданы.")
+        except sqlite3.Error as e:
+            print(f"❌ Ошибка при создании индексов: {e}")
+        finally:
+            conn.close()
@@ -2,6 +2,8 @@ import pandas as pd
 import sqlite3
 import os
 
+from summary_stats import rebuild_specialty_summary
+
 DB_FILE = 'database/journals.db'
 SCOPUS_FILE = 'data/scopus_list.xlsx'
 
@@ -72,6 +74,7 @@ def update_database_with_scopus_data(active_issns):
                 updated_count += 1
         
         conn.commit()
+        rebuild_specialty_summary(conn)
         print(f"✅ Обновление завершено. Найдено и помечено {updated_count} журналов, индексируемых в Scopus.")
 
     except sqlite3.Error as e:
@@ -3,6 +3,9 @@ import re
 import sqlite3
 import os
 
+from specialty_parser import SpecialtyParser, build_specialty_dictionary, clean_text, scan_codes
+from summary_stats import rebuild_specialty_summary
+
 DB_FILE = 'database/journals.db'
 VAK_LISK_FILE = 'data/vak_lisk.pdf'
 
@@ -12,82 +15,80 @@ def get_db_connection():
     conn.execute("PRAGMA foreign_keys = ON;")
     return conn
 
-def clean_text(text):
-    """Очищает текст от лишних пробелов и переносов строк."""
-    if text is None:
-        return ""
-    return ' '.join(text.split())
-
-def parse_specialties(text):
-    """Извлекает специальности из строки, используя поиск всех совпадений."""
-    if not text:
-        return []
-
-    # Паттерн для поиска кода и следующего за ним названия.
-    # Код: \d{1,2}(?:\.\d{1,2}){1,3}
-    # Название: .*? - любое количество символов (нежадный поиск)
-    # до тех пор, пока не встретится следующий код (через позитивный просмотр вперед)
-    # или до конца строки.
-    pattern = re.compile(r'(\d{1,2}(?:\.\d{1,2}){1,3})\s*–?\s*(.*?)(?=\s*\d{1,2}(?:\.\d{1,2}){1,3}\s*–?|$)')
-
-    specialties = []
-    for match in pattern.finditer(text):
-        code, name = match.groups()
-        cleaned_name = clean_text(name).strip(',').strip()
-        if cleaned_name:
-            specialties.append({
-                "code": clean_text(code).strip('.'), # Удаляем точки на конце, если есть
-                "name": cleaned_name
-            })
-            
-    return specialties
+def extract_vak_lisk_entries():
+    """
+    Первый проход по vak_lisk.pdf: собирает журналы с сырым текстом ячеек
+    специальностей, включая строки-продолжения.
+    """
+    entries = []
+    current_journal_data = {}
+
+    with pdfplumber.open(VAK_LISK_FILE) as pdf:
+        for page in pdf.pages:
+            table = page.extract_table()
+            if not table:
+                continue
+
+            for row in table:
+                # Проверяем, начинается ли строка с номера (например, "1.", "123.")
+                is_new_journal_entry = row[0] and re.match(r'^\d+\.', clean_text(row[0]))
+
+                if is_new_journal_entry:
+                    # Начинаем собирать данные для нового журнала
+                    current_journal_data = {
+                        "title": clean_text(row[1]),
+                        "issn": clean_text(row[2]).replace('-', ''),
+                        "specialties_texts": [clean_text(row[3])]
+                    }
+                    entries.append(current_journal_data)
+                elif current_journal_data and (row[3] or row[4]):
+                    # Если это продолжение предыдущей записи, добавляем текст специальностей
+                    current_journal_data["specialties_texts"].append(clean_text(row[3]))
+
+    return entries
+
+def get_known_specialties(cursor):
+    """Загружает уже известные специальности (номенклатуру) из базы данных."""
+    cursor.execute("SELECT code, name FROM specialties")
+    return cursor.fetchall()
 
 def process_and_load_vak_lisk():
     """
     Извлекает данные из vak_lisk.pdf, обрабатывает их и загружает в базу данных.
+    Специальности разбираются по словарю кодов из номенклатуры в базе
+    и предварительного прохода по перечню.
     """
     conn = get_db_connection()
     cursor = conn.cursor()
 
     try:
-        with pdfplumber.open(VAK_LISK_FILE) as pdf:
-            current_journal_data = {}
-
-            for page in pdf.pages:
-                table = page.extract_table()
-                if not table:
-                    continue
-
-                for row in table:
-                    # Проверяем, начинается ли строка с номера (например, "1.", "123.")
-                    is_new_journal_entry = row[0] and re.match(r'^\d+\.', clean_text(row[0]))
-
-                    if is_new_journal_entry:
-                        # Если это новая запись, сохраняем предыдущий журнал (если он был)
-                        if current_journal_data:
-                            load_journal_to_db(cursor, current_journal_data)
-                        
-                        # Начинаем собирать данные для нового журнала
-                        title = clean_text(row[1])
-                        issn = clean_text(row[2]).replace('-', '')
-                        specialties_text = clean_text(row[3])
-                        
-                        current_journal_data = {
-                            "title": title,
-                            "issn": issn,
-                            "specialties": parse_specialties(specialties_text)
-                        }
-                    elif current_journal_data and (row[3] or row[4]):
-                        # Если это продолжение предыдущей записи, добавляем специальности
-                        additional_specialties_text = clean_text(row[3])
-                        current_journal_data["specialties"].extend(parse_specialties(additional_specialties_text))
-
-            # Сохраняем последний журнал в файле
-            if current_journal_data:
-                load_journal_to_db(cursor, current_journal_data)
+        entries = extract_vak_lisk_entries()
+
+        # Каждая ячейка сканируется один раз: результат нужен и для словаря, и для разбора
+        for entry in entries:
+            entry["scanned"] = [(text, scan_codes(text)) for text in entry["specialties_texts"]]
+
+        all_scanned = [cell for entry in entries for cell in entry["scanned"]]
+        dictionary = build_specialty_dictionary(get_known_specialties(cursor), all_scanned)
+        parser = SpecialtyParser(dictionary)
+
+        for entry in entries:
+            load_journal_to_db(cursor, {
+                "title": entry["title"],
+                "issn": entry["issn"],
+                "specialties": [spec for text, codes in entry["scanned"] for spec in parser.parse(text, codes)]
+            })
 
         conn.commit()
+        rebuild_specialty_summary(conn)
         print("Данные из 'vak_lisk.pdf' успешно загружены в базу данных.")
+        print(f"Специальностей в словаре: {len(dictionary)}, "
+              f"разобрано ячеек: {parser.stats['cells']}, "
+              f"через регулярное выражение: {parser.stats['fallbacks']}, "
+              f"незнакомых кодов: {parser.stats['unknown_codes']}, "
+              f"кодов без разделителя: {parser.stats['no_separator']}")
+        if parser.unknown_codes:
+            print(f"Незнакомые коды: {', '.join(sorted(parser.unknown_codes))}")
 
     except Exception as e:
         conn.rollback()
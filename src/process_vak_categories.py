@@ -6,6 +6,8 @@ from thefuzz import fuzz, process
 import csv
 import os
 
+from summary_stats import rebuild_specialty_summary
+
 DB_FILE = 'database/journals.db'
 VAK_K_FILE = 'data/vak_k.pdf'
 REPORT_FILE = 'matching_report.csv'
@@ -91,6 +93,7 @@ def update_categories_in_db():
             cursor = conn.cursor()
             cursor.executemany("UPDATE journals SET vak_category = ? WHERE id = ?", updates_to_perform)
             conn.commit()
+            rebuild_specialty_summary(conn)
             
             # Считаем статистику
             updated_count = len([u for u in updates_to_perform if u[0] != 'К?'])
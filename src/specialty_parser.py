@@ -0,0 +1,195 @@
+import re
+
+# Код специальности: 1.2.1, 5.7.7, 05.02.13 и т.п.
+CODE_PATTERN = r'\d{1,2}(?:\.\d{1,2}){1,3}'
+
+# Исходный (регулярный) разбор ячейки: код и название до следующего кода.
+SPECIALTY_PATTERN = re.compile(rf'({CODE_PATTERN})\s*–?\s*(.*?)(?=\s*{CODE_PATTERN}\s*–?|$)')
+# Полный код: перед ним нет цифры или точки, после него код не продолжается.
+# Шаблон без ленивых повторов, поэтому поиск линейный; проверка символа
+# перед кодом идет после первой цифры, чтобы поиск быстро пропускал текст.
+FULL_CODE_REGEX = re.compile(r'\d(?<![\d.]\d)\d?(?:\.\d{1,2}){1,3}(?!\d|\.\d)')
+
+# Символы, которые остаются между кодом и названием или после названия.
+NAME_STRIP_CHARS = ' .,;–-'
+
+
+def clean_text(text):
+    """Очищает текст от лишних пробелов и переносов строк."""
+    if text is None:
+        return ""
+    return ' '.join(text.split())
+
+
+def clean_name(name):
+    """Убирает точки, тире и запятые, оставшиеся вокруг названия специальности."""
+    return clean_text(name).strip(NAME_STRIP_CHARS)
+
+
+def parse_specialties(text):
+    """Извлекает специальности из строки, используя поиск всех совпадений."""
+    if not text:
+        return []
+
+    # Код: \d{1,2}(?:\.\d{1,2}){1,3}
+    # Название: .*? - любое количество символов (нежадный поиск)
+    # до тех пор, пока не встретится следующий код (через позитивный просмотр вперед)
+    # или до конца строки.
+    specialties = []
+    for match in SPECIALTY_PATTERN.finditer(text):
+        code, name = match.groups()
+        cleaned_name = clean_text(name).strip(',').strip()
+        if cleaned_name:
+            specialties.append({
+                "code": clean_text(code).strip('.'), # Удаляем точки на конце, если есть
+                "name": cleaned_name
+            })
+
+    return specialties
+
+
+def is_specialty_boundary(text, position):
+    """
+    Проверяет, может ли с позиции position начинаться новая специальность:
+    в начале ячейки или после законченного названия (")", ",", ";").
+    """
+    i = position - 1
+    while i >= 0 and text[i].isspace():
+        i -= 1
+    return i < 0 or text[i] in '),;'
+
+
+def is_separated_code(text, start, end):
+    """
+    Проверяет, что код из трех-четырех частей отделен от названия точкой,
+    тире или пробелом. Такой код начинает специальность, даже если перед
+    ним нет ")", "," или ";" (например, "5.2.3 Экономика 5.2.4 Финансы").
+    """
+    if text.count('.', start, end) < 2:
+        return False
+    return end >= len(text) or text[end].isspace() or text[end] in '.–-'
+
+
+def scan_codes(text):
+    """
+    Находит коды, с которых начинаются специальности, за один проход.
+    Возвращает список (код, начало, конец, отделен ли код только
+    разделителем, а не законченным названием). Цифры внутри названий
+    (например, "технологии Web 2.0") в список не попадают.
+    """
+    codes = []
+    for match in FULL_CODE_REGEX.finditer(text):
+        start, end = match.span()
+        if is_specialty_boundary(text, start):
+            codes.append((match.group(), start, end, False))
+        elif is_separated_code(text, start, end):
+            codes.append((match.group(), start, end, True))
+    return codes
+
+
+def scan_cells(texts):
+    """Сканирует ячейки один раз: список пар (текст, scan_codes(текст))."""
+    return [(text, scan_codes(text)) for text in texts if text]
+
+
+def build_specialty_dictionary(known_specialties=(), scanned_cells=()):
+    """
+    Собирает словарь {код: название} известных специальностей.
+    Названия из номенклатуры (known_specialties — пары (код, название))
+    имеют приоритет; коды, которых нет в номенклатуре, добираются из
+    просканированных ячеек scanned_cells (см. scan_cells).
+    """
+    dictionary = {}
+    for code, name in known_specialties:
+        dictionary[code] = clean_name(name)
+
+    for text, codes in scanned_cells:
+        for index, (code, start, end, _) in enumerate(codes):
+            if code in dictionary:
+                continue
+            name_end = codes[index + 1][1] if index + 1 < len(codes) else len(text)
+            name = clean_name(text[end:name_end])
+            if name:
+                dictionary[code] = name
+
+    return dictionary
+
+
+class SpecialtyParser:
+    """
+    Разбирает ячейки со специальностями за один линейный проход (см.
+    scan_codes) и сверяет коды с префиксным деревом (trie) известных кодов.
+    Регулярное выражение используется только для ячеек, которые начинаются
+    с незнакомого кода.
+    """
+
+    def __init__(self, dictionary):
+        self.dictionary = dictionary
+        self.trie = {}
+        for code in dictionary:
+            node = self.trie
+            for char in code:
+                node = node.setdefault(char, {})
+            node[None] = code # Маркер конца кода
+        # no_separator — коды, отделенные от предыдущего названия
+        # только точкой или пробелом (возможна ошибка разбора)
+        self.stats = {"cells": 0, "fallbacks": 0, "unknown_codes": 0, "no_separator": 0}
+        self.unknown_codes = set()
+
+    def _is_known_code(self, code):
+        """Проверяет код по префиксному дереву известных кодов."""
+        node = self.trie
+        for char in code:
+            node = node.get(char)
+            if node is None:
+                return False
+        return None in node
+
+    def _fallback(self, text):
+        """Разбирает ячейку регулярным выражением и учитывает незнакомые коды."""
+        self.stats["fallbacks"] += 1
+        specialties = parse_specialties(text)
+        for spec in specialties:
+            spec["name"] = clean_name(spec["name"])
+            if spec["code"] not in self.dictionary:
+                self._add_unknown(spec["code"])
+        return specialties
+
+    def _add_unknown(self, code):
+        self.stats["unknown_codes"] += 1
+        self.unknown_codes.add(code)
+
+    def parse(self, text, codes=None):
+        """
+        Извлекает специальности из строки. Возвращает список {"code", "name"}.
+        codes — результат scan_codes(text), если ячейка уже просканирована.
+        """
+        if not text:
+            return []
+        self.stats["cells"] += 1
+
+        # Текст до первого кода — хвост названия из предыдущей строки, он
+        # отбрасывается. Если первым стоит незнакомый код, отдаем ячейку
+        # регулярному выражению.
+        if codes is None:
+            codes = scan_codes(text)
+        if not codes:
+            return []
+        if not self._is_known_code(codes[0][0]):
+            return self._fallback(text)
+
+        specialties = []
+        for index, (code, start, end, no_separator) in enumerate(codes):
+            name_end = codes[index + 1][1] if index + 1 < len(codes) else len(text)
+            name = clean_name(text[end:name_end])
+            if no_separator and index > 0:
+                self.stats["no_separator"] += 1
+            if not self._is_known_code(code):
+                self._add_unknown(code)
+            elif not name:
+                # Название перенесено или потеряно при извлечении — берем из словаря
+                name = self.dictionary[code]
+            if name:
+                specialties.append({"code": code, "name": name})
+
+        return specialties
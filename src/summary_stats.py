@@ -0,0 +1,98 @@
+import sqlite3
+import os
+
+DB_FILE = 'database/journals.db'
+
+# Подпись для журналов без категории ВАК (общая для сводки, фильтров и app.py)
+NO_CATEGORY = 'Нет данных'
+
+def create_summary_table(cursor):
+    """
+    Создает таблицу specialty_summary с количеством журналов по категории ВАК
+    и статусу Scopus. Уровни: 'all' — весь перечень, 'group' — группа
+    специальностей (первые две части кода), 'specialty' — специальность.
+    """
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS specialty_summary (
+        level TEXT NOT NULL,
+        code TEXT NOT NULL,
+        name TEXT,
+        vak_category TEXT NOT NULL,
+        scopus_indexed BOOLEAN NOT NULL,
+        journal_count INTEGER NOT NULL,
+        PRIMARY KEY (level, code, vak_category, scopus_indexed)
+    )
+    ''')
+
+def split_category(category):
+    """
+    Разбивает категорию ВАК на составные части: 'К1 К2' -> ['К1', 'К2'].
+    Журнал с такой категорией учитывается в каждой из них.
+    """
+    if not category or category == NO_CATEGORY:
+        return [NO_CATEGORY]
+    return category.split()
+
+def get_group_code(code):
+    """Возвращает код группы специальностей: '5.6.4' -> '5.6', '05.02.13' -> '05.02'."""
+    return '.'.join(code.split('.')[:2])
+
+def rebuild_specialty_summary(conn):
+    """
+    Пересчитывает specialty_summary по текущему содержимому базы.
+    Журнал учитывается в группе один раз, даже если он указан
+    по нескольким специальностям этой группы.
+    """
+    cursor = conn.cursor()
+    create_summary_table(cursor)
+
+    cursor.execute("""
+        SELECT j.id, j.vak_category, j.scopus_indexed, s.code, s.name
+        FROM journals j
+        LEFT JOIN journal_specialties js ON j.id = js.journal_id
+        LEFT JOIN specialties s ON js.specialty_id = s.id
+    """)
+
+    # {(level, code): {"name": ..., "journals": {journal_id: (категория, scopus)}}}
+    buckets = {}
+
+    def add(level, code, name, journal_id, key):
+        bucket = buckets.setdefault((level, code), {"name": name, "journals": {}})
+        bucket["journals"][journal_id] = key
+
+    for journal_id, category, scopus, code, name in cursor.fetchall():
+        key = (category or NO_CATEGORY, 1 if scopus else 0)
+        add('all', '', None, journal_id, key)
+        if code:
+            add('specialty', code, name, journal_id, key)
+            add('group', get_group_code(code), None, journal_id, key)
+
+    rows = []
+    for (level, code), bucket in buckets.items():
+        counts = {}
+        for key in bucket["journals"].values():
+            counts[key] = counts.get(key, 0) + 1
+        for (category, scopus), count in counts.items():
+            rows.append((level, code, bucket["name"], category, scopus, count))
+
+    cursor.execute("DELETE FROM specialty_summary")
+    cursor.executemany("""
+        INSERT INTO specialty_summary (level, code, name, vak_category, scopus_indexed, journal_count)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """, rows)
+    conn.commit()
+    return len(rows)
+
+
+if __name__ == '__main__':
+    if not os.path.exists(DB_FILE):
+        print(f"❌ База данных '{DB_FILE}' не найдена. Пожалуйста, создайте ее сначала.")
+    else:
+        conn = sqlite3.connect(DB_FILE)
+        try:
+            row_count = rebuild_specialty_summary(conn)
+            print(f"✅ Сводная статистика пересчитана: {row_count} строк в 'specialty_summary'.")
+        except sqlite3.Error as e:
+            print(f"❌ Ошибка при пересчете сводной статистики: {e}")
+        finally:
+            conn.close()